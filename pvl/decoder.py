@@ -82,6 +82,10 @@ class PVLDecoder(object):
         else:
             self.real_cls = real_cls
 
+        # The format tuples that _datetime_formats_numeric() last
+        # looked at, and its answer for them.
+        self._numeric_formats = (None, False)
+
     def decode(self, value: str):
         """Returns a Python object based on *value*."""
         return self.decode_simple_value(value)
@@ -229,6 +233,15 @@ class PVLDecoder(object):
         of the various numerical values, cast them to the appropriate
         numerical types, and do something useful with them.
         """
+        # All of the usual date and time formats start with a numeric
+        # directive, so unless the value starts with a digit, there is no
+        # need to try each of them with datetime.strptime() (which only
+        # caches the compiled regexes for a handful of formats).
+        if not value[:1].isdigit() and self._datetime_formats_numeric():
+            if self.is_leap_seconds(value):
+                return str(value)
+            raise ValueError
+
         try:
             # datetime.date objects will always be naive, so just return:
             return for_try_except(
@@ -271,6 +284,29 @@ class PVLDecoder(object):
         else:
             raise ValueError
 
+    def _datetime_formats_numeric(self) -> bool:
+        """Returns True if every one of the grammar's date, time, and
+        datetime formats starts with a directive that only matches
+        digits.
+
+        The answer is kept until one of the grammar's format tuples
+        is replaced, so that a format added after this decoder was
+        made is still noticed.
+        """
+        formats = (
+            self.grammar.date_formats,
+            self.grammar.time_formats,
+            self.grammar.datetime_formats,
+        )
+        last, numeric = self._numeric_formats
+        if formats != last:
+            numeric = all(
+                f[:2] in ("%Y", "%y", "%m", "%j", "%H", "%I", "%M", "%S")
+                for f in chain(*formats)
+            )
+            self._numeric_formats = (formats, numeric)
+        return numeric
+
     def is_leap_seconds(self, value: str) -> bool:
         """Returns True if *value* is a time that matches the
         grammar's definition of a leap seconds time (a time string with
@@ -9,6 +9,7 @@
 # top level of this library.
 
 
+import re
 from enum import Enum, auto
 
 from .grammar import PVLGrammar
@@ -315,7 +316,9 @@ def lex_continue(
     # the lexeme.
     if (
         char in g.numeric_start_chars
-        and Token(char + next_char, grammar=g).is_numeric()
+        and Token(
+            char + next_char, grammar=g, decoder=token.decoder
+        ).is_numeric()
     ):
         return True
 
@@ -328,7 +331,9 @@ def lex_continue(
     if (
         char.lower() == "e"
         and next_char in g.numeric_start_chars
-        and Token(lexeme + next_char + "2", grammar=g).is_numeric()
+        and Token(
+            lexeme + next_char + "2", grammar=g, decoder=token.decoder
+        ).is_numeric()
     ):
         return True
 
@@ -358,9 +363,21 @@ def lexer(s: str, g=PVLGrammar(), d=PVLDecoder()):
     c_info = _prepare_comment_tuples(g.comments)
     # print(c_info)
 
+    # Runs of whitespace between lexemes are skipped in one step.
+    ws_re = re.compile("[" + re.escape("".join(g.whitespace)) + "]+")
+
     lexeme = ""
     preserve = dict(state=Preserve.FALSE, end=None)
-    for i, char in enumerate(s):
+    i = -1
+    end = len(s)
+    while i + 1 < end:
+        i += 1
+        char = s[i]
+
+        if lexeme == "" and char in g.whitespace:
+            i = ws_re.match(s, i).end() - 1
+            continue
+
         if not g.char_allowed(char):
             raise LexerError(
                 f'The character "{char}" (ord: {ord(char)}) '
@@ -420,7 +437,7 @@ def lexer(s: str, g=PVLGrammar(), d=PVLDecoder()):
                 or s.startswith(tuple(p[0] for p in g.comments), i + 1)
                 or lexeme.endswith(tuple(p[1] for p in g.comments))
                 or lexeme in g.reserved_characters
-                or tok.is_quoted_string()
+                or (lexeme.startswith(g.quotes) and tok.is_quoted_string())
             ):
                 # print(f'yielding {tok}')
                 t = yield tok
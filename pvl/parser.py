@@ -43,8 +43,14 @@ from *tokens*, if an unexpected object is encountered, it will
 'return' the object to *tokens*, and raise a ``ValueError``, so
 that ``try``-``except`` blocks can be used, and the *generator
 iterator* is left in a good state. However, if a parsing anomaly
-is discovered deeper in parsing a PVL sequence, then a ``ValueError``
-will be thrown into the *tokens* generator iterator (via .throw()).
+is discovered deeper in parsing a PVL sequence, then a ``LexerError``
+(which is a subclass of ``ValueError`` that parsing functions
+do not catch) will be raised.
+
+The parse() function wraps the lexer in a ``TokenStream``, which
+provides that same protocol, but keeps the tokens it has seen in a list,
+so that 'returning' a token is just a step back of an index rather than
+a round trip through the lexer's generator.
 """
 
 # Copyright 2015, 2017, 2019-2020, ``pvl`` library authors.
@@ -54,14 +60,112 @@ will be thrown into the *tokens* generator iterator (via .throw()).
 # top level of this library.
 
 import collections.abc as abc
+import datetime
 import re
+from bisect import bisect_left
 
 from .collections import MutableMappingSequence, PVLModule, PVLGroup, PVLObject
-from .token import Token
 from .grammar import PVLGrammar, OmniGrammar
 from .decoder import PVLDecoder, OmniDecoder
 from .lexer import lexer as Lexer
 from .exceptions import LexerError, ParseError, linecount
+from .token import _grammar_sets
+
+# Flags used to classify the text of tokens, see PVLParser._kind().
+_WSC = 1
+_DELIMITER = 2
+_EQUALS = 4
+_PARAMETER_NAME = 8
+_NOT_PARAMETER_NAME = 16
+_BEGIN_AGGREGATION = 32
+_END_STATEMENT = 64
+_END_AGGREGATION = 128
+
+# Decoded Simple Values of these types can safely be shared between all
+# of the tokens with the same text, see PVLParser._decode_simple_value().
+_IMMUTABLE_VALUE_TYPES = frozenset(
+    (
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        datetime.date,
+        datetime.time,
+        datetime.datetime,
+    )
+)
+
+
+def _predicted_first(predicted, parsers: tuple) -> tuple:
+    """Returns *parsers* reordered so that *predicted* comes first,
+    and the rest follow in their original order.
+    """
+    return (predicted,) + tuple(p for p in parsers if p != predicted)
+
+
+class TokenStream(object):
+    """A list-backed stream of tokens that provides the same
+    next()/send()/throw() protocol as the lexer's *generator iterator*.
+
+    Tokens are pulled from *tokens* only as they are needed, and are
+    kept in a list, so that a token 'returned' via send() is provided
+    again by stepping the index back, rather than by going through the
+    *tokens* generator.  The parser never steps back more than a
+    token or two, so only the most recent tokens are kept, and the
+    list doesn't grow with the length of the PVL-text.
+
+    :param tokens: an iterator of ``pvl.token.Token`` objects, typically
+        the generator returned by :func:`pvl.lexer.lexer()`.
+    """
+
+    __slots__ = ("_tokens", "_buf", "_i")
+
+    # How many already-provided tokens are kept for send(), and how
+    # long the list may grow before the older ones are dropped.
+    _keep = 8
+    _trim_at = 256
+
+    def __init__(self, tokens: abc.Iterator):
+        self._tokens = tokens
+        self._buf = list()
+        self._i = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        buf = self._buf
+        i = self._i
+        if i < len(buf):
+            t = buf[i]
+        else:
+            if i >= self._trim_at:
+                del buf[: -self._keep]
+                i = self._i = len(buf)
+            t = next(self._tokens)
+            buf.append(t)
+        self._i = i + 1
+        return t
+
+    def send(self, t):
+        """'Returns' *t* to the stream, so that it will be provided
+        by the next call to next().
+        """
+        self._i -= 1
+        self._buf[self._i] = t
+
+    def throw(self, typ, val=None):
+        """Throws the exception into the underlying *tokens* generator
+        (the lexer converts a ``ValueError`` into a ``LexerError``,
+        which parsing functions do not catch), or raises it, if *tokens*
+        is not a generator.
+        """
+        if hasattr(self._tokens, "throw"):
+            return self._tokens.throw(typ, val)
+        if val is None:
+            raise typ
+        raise typ(val)
 
 
 class EmptyValueAtLine(str):
@@ -200,10 +304,24 @@ class PVLParser(object):
                 "pvl.collections.MutableMappingSequence."
             )
 
+        # The delimiters that start a Set, Sequence, or Units Expression,
+        # which parse_value() checks for every value.
+        self._set_open = self.grammar.set_delimiters[0]
+        self._sequence_open = self.grammar.sequence_delimiters[0]
+        self._units_open = self.grammar.units_delimiters[0]
+
+        # The same few token texts (keywords, delimiters, whitespace,
+        # parameter names) occur over and over in PVL-text, so their
+        # classification is only worked out once, see _kind().
+        self._token_cache = dict()
+        self._value_cache = dict()
+
     def parse(self, s: str):
         """Converts the string, *s* to a PVLModule."""
         self.doc = s
-        tokens = self.lexer(s, g=self.grammar, d=self.decoder)
+        self._token_cache.clear()
+        self._value_cache.clear()
+        tokens = TokenStream(self.lexer(s, g=self.grammar, d=self.decoder))
         module = self.parse_module(tokens)
         module.errors = sorted(self.errors)
         return module
@@ -215,20 +333,113 @@ class PVLParser(object):
         keywords for this parser's grammar, then it will raise a
         ValueError.
         """
+        # Keywords should always be compared case-independently.
         begin_fold = begin.casefold()
-        for gk in self.grammar.group_keywords.keys():
-            if begin_fold == gk.casefold():
-                return self.grpcls()
+        sets = _grammar_sets(self.grammar)
+        if begin_fold in sets.group_keywords:
+            return self.grpcls()
 
-        for ok in self.grammar.object_keywords.keys():
-            if begin_fold == ok.casefold():
-                return self.objcls()
+        if begin_fold in sets.object_keywords:
+            return self.objcls()
 
         raise ValueError(
             f'The value "{begin}" did not match a Begin '
             "Aggregation Statement."
         )
 
+    def _is_parameter_name(self, s: str) -> bool:
+        """Returns true if *s* would be a Parameter Name according to
+        this parser's grammar and decoder, false otherwise.
+
+        This gives the same result as ``Token.is_parameter_name()``
+        but does not need to construct a Token to do so.
+        """
+        sets = _grammar_sets(self.grammar)
+        if s.casefold() in sets.reserved_keywords:
+            return False
+
+        # A Parameter Name may not contain any reserved characters,
+        # whitespace, or comment delimiters, these are the same
+        # checks that Token.is_unquoted_string() makes.
+        if not sets.not_unquoted.isdisjoint(s):
+            return False
+
+        for d in sets.comment_delimiters:
+            if d in s:
+                return False
+
+        for decode in (
+            self.decoder.decode_decimal,
+            self.decoder.decode_non_decimal,
+            self.decoder.decode_datetime,
+        ):
+            try:
+                decode(s)
+                return False
+            except ValueError:
+                pass
+
+        return True
+
+    def _error(self, msg: str, t) -> LexerError:
+        """Returns a LexerError with *msg* at the position of the
+        token *t*.
+
+        This is for parsing anomalies that are discovered deeper in
+        parsing a PVL sequence, which should not be treated as a
+        parsing strategy that didn't work (a plain ``ValueError``).
+        """
+        return LexerError(msg, self.doc, t.pos + len(t) - 1, t)
+
+    def _kind(self, t) -> int:
+        """Returns the classification flags for the token *t*.
+
+        The flags are determined from *t*'s is_WSC(), is_delimiter(),
+        is_begin_aggregation() and is_end_statement() functions (or
+        whether it is an equals sign or an end aggregation keyword) the
+        first time that the text of *t* is seen, and are looked up
+        after that.
+        """
+        try:
+            return self._token_cache[t]
+        except KeyError:
+            if t.is_WSC():
+                kind = _WSC
+            elif t.is_delimiter():
+                kind = _DELIMITER
+            elif t == "=":
+                kind = _EQUALS
+            elif t.is_begin_aggregation():
+                kind = _BEGIN_AGGREGATION
+            elif t.is_end_statement():
+                kind = _END_STATEMENT
+            elif (
+                t.casefold()
+                in _grammar_sets(self.grammar).end_aggregation_keywords
+            ):
+                kind = _END_AGGREGATION
+            else:
+                kind = 0
+            self._token_cache[str(t)] = kind
+            return kind
+
+    def _is_parameter_name_token(self, t) -> bool:
+        """Returns true if the token *t* is a Parameter Name, which
+        is only worked out once for each distinct token text.
+        """
+        kind = self._kind(t)
+        if kind & _PARAMETER_NAME:
+            return True
+        if kind & (_NOT_PARAMETER_NAME | _WSC | _DELIMITER | _EQUALS):
+            return False
+
+        if self._is_parameter_name(t):
+            self._token_cache[t] = kind | _PARAMETER_NAME
+            return True
+        else:
+            self._token_cache[t] = kind | _NOT_PARAMETER_NAME
+            return False
+
     def parse_module(self, tokens: abc.Generator):
         """Parses the tokens for a PVL Module.
 
@@ -239,49 +450,93 @@ class PVLParser(object):
         """
         m = self.modcls()
 
-        parsing = True
-        while parsing:
+        while True:
             # print(f'top of while parsing: {m}')
-            parsing = False
-            for p in (
-                self.parse_aggregation_block,
-                self.parse_assignment_statement,
-                self.parse_end_statement,
-            ):
+            for p in self._statement_parsers(tokens):
                 try:
                     self.parse_WSC_until(None, tokens)
-                    # t = next(tokens)
-                    # print(f'next token: {t}, {t.pos}')
-                    # tokens.send(t)
                     parsed = p(tokens)
                     # print(f'parsed: {parsed}')
-                    if parsed is None:  # because parse_end_statement returned
-                        return m
-                    else:
-                        m.append(*parsed)
-                        parsing = True
                 except LexerError:
                     raise
                 except ValueError:
-                    pass
-            try:
-                (m, keep_parsing) = self.parse_module_post_hook(m, tokens)
-                if keep_parsing:
-                    parsing = True
-                else:
+                    continue
+
+                if parsed is None:  # because parse_end_statement returned
+                    return m
+                m.append(parsed[0], parsed[1])
+                break
+            else:
+                # None of the parsing functions succeeded.
+                try:
+                    (m, keep_parsing) = self.parse_module_post_hook(m, tokens)
+                except Exception:
+                    break
+                if not keep_parsing:
                     return m
-            except Exception:
-                pass
 
         # print(f'got to bottom: {m}')
         t = next(tokens)
-        tokens.throw(
-            ValueError,
+        raise self._error(
             "Expecting an Aggregation Block, an Assignment "
             "Statement, or an End Statement, but found "
             f'"{t}" ',
+            t,
         )
 
+    def _statement_parsers(
+        self, tokens: abc.Generator, aggregation: bool = False
+    ) -> tuple:
+        """Returns the parsing functions to try, in order, for the
+        next statement in *tokens*.
+
+        The first token of a statement determines which parsing
+        function should succeed: a Parameter Name starts an
+        Assignment-Statement, a begin aggregation keyword an
+        Aggregation Block, an end statement keyword an End-Statement,
+        and an end aggregation keyword none of them (it can only be
+        the end of an enclosing Aggregation Block).  Trying that
+        function first avoids raising and catching a ValueError for
+        each of the alternatives that come before it.  If it fails,
+        the others are still tried in their usual order, so that
+        the same input is accepted as before.
+
+        If *aggregation* is true, the statement is inside of an
+        Aggregation Block, where an End-Statement is not allowed, and
+        parse_end_aggregation() is left to deal with the statement if
+        none of the returned functions succeed.
+        """
+        self.parse_WSC_until(None, tokens)
+        try:
+            t = next(tokens)
+        except StopIteration:
+            return () if aggregation else (self.parse_end_statement,)
+        tokens.send(t)
+
+        if aggregation:
+            parsers = (
+                self.parse_aggregation_block,
+                self.parse_assignment_statement,
+            )
+        else:
+            parsers = (
+                self.parse_aggregation_block,
+                self.parse_assignment_statement,
+                self.parse_end_statement,
+            )
+
+        if self._is_parameter_name_token(t):
+            return _predicted_first(self.parse_assignment_statement, parsers)
+        kind = self._kind(t)
+        if kind & _BEGIN_AGGREGATION:
+            return _predicted_first(self.parse_aggregation_block, parsers)
+        elif kind & _END_STATEMENT and not aggregation:
+            return (self.parse_end_statement,)
+        elif kind & (_END_STATEMENT | _END_AGGREGATION):
+            return ()
+        else:
+            return parsers
+
     def parse_module_post_hook(
         self, module: MutableMappingSequence, tokens: abc.Generator
     ):
@@ -323,38 +578,30 @@ class PVLParser(object):
         agg = self.aggregation_cls(begin)
 
         while True:
-            self.parse_WSC_until(None, tokens)
-            try:
-                agg.append(*self.parse_aggregation_block(tokens))
-            except LexerError:
-                raise
-            except ValueError:
+            for p in self._statement_parsers(tokens, aggregation=True):
                 try:
-                    agg.append(*self.parse_assignment_statement(tokens))
-                    # print(f'agg: {agg}')
-                    # t = next(tokens)
-                    # print(f'next token is: {t}')
-                    # tokens.send(t)
+                    (key, value) = p(tokens)
+                    agg.append(key, value)
+                    break
                 except LexerError:
                     raise
                 except ValueError:
-                    # t = next(tokens)
-                    # print(f'parsing agg block, next token is: {t}')
-                    # tokens.send(t)
+                    pass
+            else:
+                try:
+                    self.parse_end_aggregation(begin, block_name, tokens)
+                    break
+                except LexerError:
+                    raise
+                except ValueError as ve:
                     try:
-                        self.parse_end_aggregation(begin, block_name, tokens)
-                        break
-                    except LexerError:
-                        raise
-                    except ValueError as ve:
-                        try:
-                            (agg, keep_parsing) = self.parse_module_post_hook(
-                                agg, tokens
-                            )
-                            if not keep_parsing:
-                                raise ve
-                        except Exception:
+                        (agg, keep_parsing) = self.parse_module_post_hook(
+                            agg, tokens
+                        )
+                        if not keep_parsing:
                             raise ve
+                    except Exception:
+                        raise ve
 
         return block_name, agg
 
@@ -372,13 +619,15 @@ class PVLParser(object):
           <WSC>* '=' <WSC>*
 
         """
-        if not self.parse_WSC_until("=", tokens):
-            try:
-                t = next(tokens)
+        for t in tokens:
+            kind = self._kind(t)
+            if kind & _EQUALS:
+                break
+            elif not kind & _WSC:
                 tokens.send(t)
                 raise ValueError(f'Expecting "=", got: {t}')
-            except StopIteration:
-                raise ParseError('Expecting "=", but ran out of tokens.')
+        else:
+            raise ParseError('Expecting "=", but ran out of tokens.')
 
         self.parse_WSC_until(None, tokens)
         return
@@ -398,7 +647,7 @@ class PVLParser(object):
         """
         try:
             begin = next(tokens)
-            if not begin.is_begin_aggregation():
+            if not self._kind(begin) & _BEGIN_AGGREGATION:
                 tokens.send(begin)
                 raise ValueError(
                     "Expecting a Begin-Aggegation-Statement, but "
@@ -413,16 +662,16 @@ class PVLParser(object):
         try:
             self.parse_around_equals(tokens)
         except ValueError:
-            tokens.throw(
-                ValueError, f'Expecting an equals sign after "{begin}" '
+            raise self._error(
+                f'Expecting an equals sign after "{begin}" ', begin
             )
 
         block_name = next(tokens)
-        if not block_name.is_parameter_name():
-            tokens.throw(
-                ValueError,
+        if not self._is_parameter_name_token(block_name):
+            raise self._error(
                 f'Expecting a Block-Name after "{begin} =" '
                 f'but found: "{block_name}"',
+                block_name,
             )
 
         self.parse_statement_delimiter(tokens)
@@ -443,16 +692,9 @@ class PVLParser(object):
         """
         end_agg = next(tokens)
 
-        # Need to do a little song and dance to case-independently
-        # match the keys:
-        for k in self.grammar.aggregation_keywords.keys():
-            if k.casefold() == begin_agg.casefold():
-                truecase_begin = k
-                break
-        if (
-            end_agg.casefold()
-            != self.grammar.aggregation_keywords[truecase_begin].casefold()
-        ):
+        # The keywords are matched case-independently.
+        end_aggregations = _grammar_sets(self.grammar).end_aggregations
+        if end_agg.casefold() != end_aggregations.get(begin_agg.casefold()):
             tokens.send(end_agg)
             raise ValueError(
                 "Expecting an End-Aggegation-Statement that "
@@ -469,11 +711,11 @@ class PVLParser(object):
         t = next(tokens)
         if t != block_name:
             tokens.send(t)
-            tokens.throw(
-                ValueError,
+            raise self._error(
                 f'Expecting a Block-Name after "{end_agg} =" '
                 f'that matches "{block_name}", but found: '
                 f'"{t}"',
+                t,
             )
 
         self.parse_statement_delimiter(tokens)
@@ -488,7 +730,7 @@ class PVLParser(object):
         """
         try:
             end = next(tokens)
-            if not end.is_end_statement():
+            if not self._kind(end) & _END_STATEMENT:
                 tokens.send(end)
                 raise ValueError(
                     "Expecting an End Statement, like "
@@ -536,7 +778,7 @@ class PVLParser(object):
         """
         try:
             t = next(tokens)
-            if t.is_parameter_name():
+            if self._is_parameter_name_token(t):
                 parameter_name = str(t)
             else:
                 tokens.send(t)
@@ -566,8 +808,7 @@ class PVLParser(object):
 
         return parameter_name, value
 
-    @staticmethod
-    def parse_WSC_until(token: str, tokens: abc.Generator) -> bool:
+    def parse_WSC_until(self, token: str, tokens: abc.Generator) -> bool:
         """Consumes objects from *tokens*, if the object's *.is_WSC()*
         function returns *True*, it will continue until *token* is
         encountered and will return *True*.  If it encounters an object
@@ -577,10 +818,11 @@ class PVLParser(object):
         *tokens* is expected to be a *generator iterator* which
         provides ``pvl.token`` objects.
         """
+        kind_of = self._kind
         for t in tokens:
             if t == token:
                 return True
-            elif t.is_WSC():
+            elif kind_of(t) & _WSC:
                 # If there's a comment, could parse here.
                 pass
             else:
@@ -601,29 +843,32 @@ class PVLParser(object):
                 f'Expecting a begin delimiter "{delimiters[0]}" '
                 f'but found: "{t}"'
             )
+        end = delimiters[1]
+        parse_WSC_until = self.parse_WSC_until
+        parse_value = self.parse_value
         set_seq = list()
         # Initial WSC and/or empty
-        if self.parse_WSC_until(delimiters[1], tokens):
+        if parse_WSC_until(end, tokens):
             return set_seq
 
         # First item:
-        set_seq.append(self.parse_value(tokens))
-        if self.parse_WSC_until(delimiters[1], tokens):
+        set_seq.append(parse_value(tokens))
+        if parse_WSC_until(end, tokens):
             return set_seq
 
         # Remaining items, if any
         for t in tokens:
             # print(f'in loop, t: {t}, set_seq: {set_seq}')
             if t == ",":
-                self.parse_WSC_until(None, tokens)  # consume WSC after ','
-                set_seq.append(self.parse_value(tokens))
-                if self.parse_WSC_until(delimiters[1], tokens):
+                parse_WSC_until(None, tokens)  # consume WSC after ','
+                set_seq.append(parse_value(tokens))
+                if parse_WSC_until(end, tokens):
                     return set_seq
             else:
                 tokens.send(t)
-                tokens.throw(
-                    ValueError,
+                raise self._error(
                     "While parsing, expected a comma (,)" f'but found: "{t}"',
+                    t,
                 )
 
     def parse_set(self, tokens: abc.Generator) -> frozenset:
@@ -659,8 +904,7 @@ class PVLParser(object):
         """
         return self._parse_set_seq(self.grammar.sequence_delimiters, tokens)
 
-    @staticmethod
-    def parse_statement_delimiter(tokens: abc.Generator) -> bool:
+    def parse_statement_delimiter(self, tokens: abc.Generator) -> bool:
         """Parses the tokens for a Statement Delimiter.
 
         *tokens* is expected to be a *generator iterator* which
@@ -678,11 +922,13 @@ class PVLParser(object):
 
         Typically written [<Statement-Delimiter>].
         """
+        kind_of = self._kind
         for t in tokens:
-            if t.is_WSC():
+            kind = kind_of(t)
+            if kind & _WSC:
                 # If there's a comment, could parse here.
                 pass
-            elif t.is_delimiter():
+            elif kind & _DELIMITER:
                 return True
             else:
                 tokens.send(t)  # Put the next token back into the generator
@@ -696,46 +942,89 @@ class PVLParser(object):
 
         Returns the decoded <Value> as an appropriate Python object.
         """
-        value = None
+        t = next(tokens)
+        value, p = self._select_value_parser(t)
 
-        try:
-            t = next(tokens)
-            value = self.decoder.decode_simple_value(t)
-        except ValueError:
+        if p is not None:
             tokens.send(t)
-            for p in (
-                self.parse_set,
-                self.parse_sequence,
-                self.parse_value_post_hook,
-            ):
-                try:
-                    value = p(tokens)
-                    break
-                except LexerError:
-                    # A LexerError is a subclass of ValueError, but
-                    # if we get a LexerError, that's a problem and
-                    # we need to raise it, and not let it pass.
-                    raise
-                except ValueError:
-                    # Getting a ValueError is a normal consequence of
-                    # one of the parsing strategies not working,
-                    # this pass allows us to go to the next one.
-                    pass
-            else:
-                tokens.throw(
-                    ValueError,
+            try:
+                value = p(tokens)
+            except LexerError:
+                # A LexerError is a subclass of ValueError, but
+                # if we get a LexerError, that's a problem and
+                # we need to raise it, and not let it pass.
+                raise
+            except ValueError:
+                raise self._error(
                     "Was expecting a Simple Value, or the "
                     "beginning of a Set or Sequence, but "
                     f'found: "{t}"',
+                    t,
                 )
 
         # print(f'in parse_value, value is: {value}')
         self.parse_WSC_until(None, tokens)
+
+        return self._parse_optional_units(value, tokens)
+
+    def _select_value_parser(self, t):
+        """Returns a two-tuple of the decoded Simple Value of the
+        token *t* and None, or None and the parse method that must
+        be used on the tokens that *t* begins.
+
+        The first token tells which parsing strategy could possibly
+        work, so a Set or Sequence doesn't first have to fail to
+        decode as a Simple Value.
+        """
+        if t == self._set_open:
+            return None, self.parse_set
+        elif t == self._sequence_open:
+            return None, self.parse_sequence
+        else:
+            try:
+                return self._decode_simple_value(t), None
+            except ValueError:
+                return None, self.parse_value_post_hook
+
+    def _parse_optional_units(self, value, tokens: abc.Generator):
+        """Returns the result of parse_units() if the next token
+        opens a <Units Expression>, otherwise just returns *value*.
+
+        Most values don't have units, and there's no need to have
+        parse_units() raise (and format the message of) a ValueError
+        to find that out.
+        """
+        try:
+            t = next(tokens)
+        except StopIteration:
+            return value
+        tokens.send(t)
+        if not t.startswith(self._units_open):
+            return value
+
         try:
             return self.parse_units(value, tokens)
         except (ValueError, StopIteration):
             return value
 
+    def _decode_simple_value(self, t):
+        """Returns the result of the decoder's decode_simple_value()
+        for the token *t*.
+
+        Labels repeat the same value texts (units, flags, N/A, etc.)
+        over and over, so immutable results are kept and reused for
+        the rest of the parse, rather than running them through the
+        decoder's cascade of attempts (including the datetime formats)
+        every time.
+        """
+        try:
+            return self._value_cache[t]
+        except KeyError:
+            value = self.decoder.decode_simple_value(t)
+            if type(value) in _IMMUTABLE_VALUE_TYPES:
+                self._value_cache[str(t)] = value
+            return value
+
     def parse_value_post_hook(self, tokens):
         """This function is meant to be overridden by subclasses
         that may want to perform some extra processing if
@@ -766,34 +1055,39 @@ class PVLParser(object):
         Returns the *value* and the <Units-Value> as a ``Units()``
         object.
         """
+        (udo, udc) = self.grammar.units_delimiters
         t = next(tokens)
 
-        if not t.startswith(self.grammar.units_delimiters[0]):
+        if not t.startswith(udo):
             tokens.send(t)
             raise ValueError(
                 "Was expecting the start units delimiter, "
-                + '"{}" '.format(self.grammar.units_delimiters[0])
+                + f'"{udo}" '
                 + f'but found "{t}"'
             )
 
-        if not t.endswith(self.grammar.units_delimiters[1]):
+        if not t.endswith(udc):
             tokens.send(t)
             raise ValueError(
                 "Was expecting the end units delimiter, "
-                + '"{}" '.format(self.grammar.units_delimiters[1])
+                + f'"{udc}" '
                 + f'at the end, but found "{t}"'
             )
 
-        delim_strip = t.strip("".join(self.grammar.units_delimiters))
+        # str.strip(), rather than Token.strip(), since these
+        # intermediate strings don't need to be Tokens.
+        delim_strip = str.strip(t, udo + udc)
 
-        units_value = delim_strip.strip("".join(self.grammar.whitespace))
+        units_value = delim_strip.strip(
+            _grammar_sets(self.grammar).whitespace_str
+        )
 
-        for d in self.grammar.units_delimiters:
+        for d in (udo, udc):
             if d in units_value:
-                tokens.throw(
-                    ValueError,
+                raise self._error(
                     "Was expecting a units character, but found a "
                     f'unit delimiter, "{d}" instead.',
+                    t,
                 )
 
         return self.decoder.decode_quantity(value, units_value)
@@ -837,8 +1131,37 @@ class OmniParser(PVLParser):
     all forms of "PVL" that are thrown at it.
     """
 
+    # A dash at the end of a line, and the whitespace at the start of
+    # the line that follows it, see parse().
+    _dash_continuation_re = re.compile(r"-[\n\r\f]\s*")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._eq_positions = (None, [])
+
+    def _equals_positions(self) -> list:
+        """Returns the sorted indexes of every equals sign in
+        self.doc, which are only determined the first time that
+        they are needed for a given document.
+        """
+        if self._eq_positions[0] is not self.doc:
+            self._eq_positions = (
+                self.doc,
+                [m.start() for m in re.finditer("=", self.doc)],
+            )
+        return self._eq_positions[1]
+
+    def _find_equals(self, pos: int) -> int:
+        """Returns the same as self.doc.find("=", pos)."""
+        eqs = self._equals_positions()
+        i = bisect_left(eqs, pos)
+        return eqs[i] if i < len(eqs) else -1
+
     def _empty_value(self, pos):
-        eq_pos = self.doc.rfind("=", 0, pos)
+        # The same as self.doc.rfind("=", 0, pos)
+        eqs = self._equals_positions()
+        i = bisect_left(eqs, pos)
+        eq_pos = eqs[i - 1] if i > 0 else -1
         lc = linecount(self.doc, eq_pos)
         self.errors.append(lc)
         return EmptyValueAtLine(lc)
@@ -852,7 +1175,7 @@ class OmniParser(PVLParser):
         all whitespace characters that begin the next line will
         be removed.
         """
-        nodash = re.sub(r"-[\n\r\f]\s*", "", s)
+        nodash = self._dash_continuation_re.sub("", s)
         self.doc = nodash
 
         return super().parse(nodash)
@@ -876,26 +1199,22 @@ class OmniParser(PVLParser):
             t = next(tokens)
             if t == "=" and len(module) != 0:
                 (last_k, last_v) = module[-1]
-                last_token = Token(
-                    last_v, grammar=self.grammar, decoder=self.decoder
-                )
-                if last_token.is_parameter_name():
+                last_v = str(last_v)
+                if self._is_parameter_name(last_v):
                     # Fix the previous entry
                     module.pop()
                     module.append(last_k, self._empty_value(t.pos))
-                    # Now use last_token as the parameter name
+                    # Now use last_v as the parameter name
                     # for the next assignment, and we must
                     # reproduce the last part of parse-assignment:
                     try:
-                        # print(f'parameter name: {last_token}')
+                        # print(f'parameter name: {last_v}')
                         self.parse_WSC_until(None, tokens)
                         value = self.parse_value(tokens)
                         self.parse_statement_delimiter(tokens)
-                        module.append(str(last_token), value)
+                        module.append(last_v, value)
                     except StopIteration:
-                        module.append(
-                            str(last_token), self._empty_value(t.pos + 1)
-                        )
+                        module.append(last_v, self._empty_value(t.pos + 1))
                         return module, False  # return through parse_module()
                 else:
                     tokens.send(t)
@@ -904,7 +1223,7 @@ class OmniParser(PVLParser):
                 # empty, so we want return the token and signal
                 # parse_module() that it should ignore us.
                 tokens.send(t)
-                raise Exception
+                raise ParseError("Not an empty Assignment-Statement.", t)
 
             # Peeking at the next token gives us the opportunity to
             # see if we're at the end of tokens, which we want to handle.
@@ -925,7 +1244,7 @@ class OmniParser(PVLParser):
             return super().parse_assignment_statement(tokens)
         except ParseError as err:
             if err.token is not None:
-                after_eq = self.doc.find("=", err.token.pos) + 1
+                after_eq = self._find_equals(err.token.pos) + 1
                 return str(err.token), self._empty_value(after_eq)
             else:
                 raise
@@ -941,14 +1260,9 @@ class OmniParser(PVLParser):
 
         t = next(tokens)
         # print(f't: {t}')
-        truecase_reserved = [
-            x.casefold() for x in self.grammar.reserved_keywords
-        ]
-        trucase_delim = [x.casefold() for x in self.grammar.delimiters]
-        if t.casefold() in (truecase_reserved + trucase_delim):
-            # print(f'kw: {kw}')
-            # if kw.casefold() == t.casefold():
-            # print('match')
+        fold = t.casefold()
+        sets = _grammar_sets(self.grammar)
+        if fold in sets.reserved_keywords or fold in sets.delimiters:
             tokens.send(t)
             return self._empty_value(t.pos)
         else:
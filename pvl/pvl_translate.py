@@ -27,11 +27,15 @@ class Writer(object):
     """Base class for writers.  Descendents must implement dump().
     """
 
+    __slots__ = ()
+
     def dump(self, dictlike: dict, outfile: os.PathLike):
         raise Exception
 
 
 class PVLWriter(Writer):
+    __slots__ = ("encoder",)
+
     def __init__(self, encoder):
         self.encoder = encoder
 
@@ -40,6 +44,8 @@ class PVLWriter(Writer):
 
 
 class JSONWriter(Writer):
+    __slots__ = ()
+
     def dump(self, dictlike: dict, outfile: os.PathLike):
         return json.dump(dictlike, outfile)
 
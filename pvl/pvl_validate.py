@@ -21,6 +21,8 @@ labels).
 import argparse
 import logging
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 import pvl
 from .lexer import LexerError
@@ -104,20 +106,17 @@ def arg_parser():
 def main(argv=None):
     args = arg_parser().parse_args(argv)
 
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s", level=(60 - 20 * args.verbose)
-    )
-
-    results_list = list()
-    for f in args.file:
-        pvl_text = pvl.get_text_from(f)
-
-        results = dict()
-
-        for k, v in dialects.items():
-            results[k] = pvl_flavor(pvl_text, k, v, f, args.verbose)
+    configure_logging(args.verbose)
 
-        results_list.append((f, results))
+    if len(args.file) == 1:
+        results_list = [validate_file(args.file[0], args.verbose)]
+    else:
+        # The files are independent, and parsing is CPU-bound, so
+        # spread them over processes (map() preserves their order).
+        with ProcessPoolExecutor() as executor:
+            results_list = list(
+                executor.map(validate_file, args.file, repeat(args.verbose))
+            )
 
     # Writing the flavors out again to preserve order.
     if args.verbose > 0:
@@ -126,6 +125,35 @@ def main(argv=None):
     return
 
 
+def configure_logging(verbose=0):
+    """Sets up logging so that the number of *verbose* flags given
+    determines which messages are reported.
+    """
+    logging.basicConfig(
+        format="%(levelname)s: %(message)s", level=(60 - 20 * verbose)
+    )
+
+
+def validate_file(filename, verbose=False) -> tuple:
+    """Returns a two-tuple of the *filename* and a dict whose keys
+    are the names of the dialects, and whose values are the results
+    of pvl_flavor() for the PVL text in *filename*.
+    """
+    # This may be running in a worker process, which doesn't
+    # inherit main()'s logging set up under the spawn start method.
+    # If logging is already configured, this does nothing.
+    configure_logging(verbose)
+
+    pvl_text = pvl.get_text_from(filename)
+
+    results = dict()
+
+    for k, v in dialects.items():
+        results[k] = pvl_flavor(pvl_text, k, v, filename, verbose)
+
+    return filename, results
+
+
 def pvl_flavor(
     text, dialect, decenc: dict, filename, verbose=False
 ) -> tuple((bool, bool)):
@@ -224,18 +252,17 @@ def report_many(r_list: list, flavors: list) -> str:
     lines.append(build_line(header, headerw))
     lines.append(rule_line)
 
+    # The widths are the same for every row, so the format spec for
+    # the load and encode results in a cell is only built once.
+    cell_template = f"{{0:^{col2w}}} {{1:^{col3w}}}"
+
     for r in r_list:
         cells = [r[0]]
-        widths = [col1w]
         for f in flavors:
-            # cells.append(loads[r[1][f][0]] + ' ' + encodes[r[1][f][1]])
             cells.append(
-                "{0:^{w2}} {1:^{w3}}".format(
-                    loads[r[1][f][0]], encodes[r[1][f][1]], w2=col2w, w3=col3w
-                )
+                cell_template.format(loads[r[1][f][0]], encodes[r[1][f][1]])
             )
-            widths.append(flavorw)
-        lines.append(build_line(cells, widths))
+        lines.append(build_line(cells, headerw))
 
     return "\n".join(lines)
 
@@ -244,10 +271,11 @@ def build_line(elements: list, widths: list, sep=" | ") -> str:
     """Returns a string formatted from the *elements* and *widths*
        provided.
     """
-    cells = list()
-    cells.append("{0:<{width}}".format(elements[0], width=widths[0]))
+    cells = [elements[0].ljust(widths[0])]
 
+    # str.center() pads odd amounts on the left, but the "^" format
+    # spec pads them on the right, which the report layout expects.
     for e, w in zip(elements[1:], widths[1:]):
-        cells.append("{0:^{width}}".format(e, width=w))
+        cells.append(format(e, f"^{w}"))
 
     return sep.join(cells)
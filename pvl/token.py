@@ -7,10 +7,115 @@
 # top level of this library.
 
 
+import re
+from collections import namedtuple
+
 from .decoder import PVLDecoder
 from .grammar import PVLGrammar
 
 
+class _GrammarSets(
+    namedtuple(
+        "_GrammarSets",
+        [
+            "whitespace",
+            "whitespace_str",
+            "whitespace_re",
+            "not_unquoted",
+            "comment_delimiters",
+            "delimiters",
+            "aggregation_keywords",
+            "group_keywords",
+            "object_keywords",
+            "end_aggregations",
+            "end_aggregation_keywords",
+            "end_statements",
+            "reserved_keywords",
+        ],
+    )
+):
+    """The sets and strings that the Token predicates (and the parser)
+    need from a grammar, with all of the keywords already case-folded.
+    """
+
+
+def _grammar_sets(grammar) -> _GrammarSets:
+    """Returns the _GrammarSets for *grammar*.
+
+    They are kept on the grammar object, along with the grammar
+    attributes that they were derived from, and are rebuilt if any
+    of those attributes have been replaced since.  Changes made in
+    place (like adding an entry to a grammar's keyword dict) are not
+    noticed, so assign a new value to the attribute instead.
+    """
+    source = (
+        grammar.whitespace,
+        grammar.reserved_characters,
+        grammar.comments,
+        grammar.delimiters,
+        grammar.aggregation_keywords,
+        grammar.group_keywords,
+        grammar.object_keywords,
+        grammar.end_statements,
+        grammar.reserved_keywords,
+    )
+    try:
+        (built_from, sets) = grammar._token_sets
+        if built_from == source:
+            return sets
+    except AttributeError:
+        pass
+
+    if grammar.whitespace:
+        ws_re = "[" + re.escape("".join(grammar.whitespace)) + "]+"
+    else:
+        ws_re = "(?!)"
+
+    sets = _GrammarSets(
+        whitespace=frozenset(grammar.whitespace),
+        whitespace_str="".join(grammar.whitespace),
+        whitespace_re=re.compile(ws_re),
+        not_unquoted=frozenset(grammar.reserved_characters).union(
+            grammar.whitespace
+        ),
+        comment_delimiters=tuple(
+            d for pair in grammar.comments for d in pair
+        ),
+        delimiters=frozenset(d.casefold() for d in grammar.delimiters),
+        aggregation_keywords=frozenset(
+            k.casefold() for k in grammar.aggregation_keywords.keys()
+        ),
+        group_keywords=frozenset(
+            k.casefold() for k in grammar.group_keywords.keys()
+        ),
+        object_keywords=frozenset(
+            k.casefold() for k in grammar.object_keywords.keys()
+        ),
+        end_aggregations={
+            k.casefold(): v.casefold()
+            for k, v in grammar.aggregation_keywords.items()
+        },
+        end_aggregation_keywords=frozenset(
+            v.casefold() for v in grammar.aggregation_keywords.values()
+        ),
+        end_statements=frozenset(e.casefold() for e in grammar.end_statements),
+        reserved_keywords=frozenset(
+            w.casefold() for w in grammar.reserved_keywords
+        ),
+    )
+    # The tuples hold the very same objects, so that comparing them
+    # only has to check identities, and stays cheap enough to do for
+    # every Token predicate call.
+    grammar._token_sets = (source, sets)
+    return sets
+
+
+# Shared by all of the Tokens that are made without a grammar or a decoder,
+# rather than building a new pair for each of them.
+_default_grammar = PVLGrammar()
+_default_decoder = PVLDecoder(grammar=_default_grammar)
+
+
 class Token(str):
     """A PVL-aware string.
 
@@ -27,15 +132,19 @@ class Token(str):
               Token in the source string, defaults to zero.
     """
 
+    # Tokens are made for every lexeme, so they don't carry a __dict__.
+    __slots__ = ("grammar", "decoder", "pos", "_casefold")
+
     def __new__(cls, content, grammar=None, decoder=None, pos=0):
-        return str.__new__(cls, content)
+        # Everything is set up here, rather than in an __init__().
+        self = str.__new__(cls, content)
 
-    def __init__(self, content, grammar=None, decoder=None, pos=0):
         if grammar is None:
             if decoder is not None:
                 self.grammar = decoder.grammar
             else:
-                self.grammar = PVLGrammar()
+                self.grammar = _default_grammar
+                decoder = _default_decoder
         elif isinstance(grammar, PVLGrammar):
             self.grammar = grammar
         else:
@@ -49,34 +158,42 @@ class Token(str):
             raise TypeError("The decoder object is not of type PVLDecoder.")
 
         self.pos = pos
+        return self
 
     def __repr__(self):
         return f"{self.__class__.__name__}('{self}', " f"'{self.grammar}')"
 
     def __index__(self):
         if self.is_decimal():
-            try:
-                return self.decoder.decode_non_decimal(str(self))
-            except ValueError:
-                if int(str(self)) == float(str(self)):
-                    return int(str(self))
+            i = int(str(self))
+            if i == float(str(self)):
+                return i
 
-        raise ValueError(f"The {self:r} cannot be used as an index.")
+        raise ValueError(f"The {self!r} cannot be used as an index.")
 
     def __float__(self):
         return float(self.decoder.decode_decimal(str(self)))
 
+    def casefold(self) -> str:
+        """Extends ``str.casefold()`` so that the case-folded text,
+        which keyword comparisons need over and over, is only
+        computed once for this Token.
+        """
+        try:
+            return self._casefold
+        except AttributeError:
+            self._casefold = super().casefold()
+            return self._casefold
+
     def split(self, sep=None, maxsplit=-1) -> list:
         """Extends ``str.split()`` that calling split() on a Token
         returns a list of Tokens.
         """
-        str_list = super().split(sep, maxsplit)
-        tkn_list = list()
-        for t in str_list:
-            tkn_list.append(
-                Token(t, grammar=self.grammar, decoder=self.decoder)
-            )
-        return tkn_list
+        (g, d) = (self.grammar, self.decoder)
+        return [
+            Token(t, grammar=g, decoder=d)
+            for t in str.split(self, sep, maxsplit)
+        ]
 
     def replace(self, *args):
         """Extends ``str.replace()`` to return a Token."""
@@ -108,7 +225,7 @@ class Token(str):
     def _strip(self, strip_func, chars=None):
         # Shared functionality for the various strip functions.
         if chars is None:
-            chars = "".join(self.grammar.whitespace)
+            chars = _grammar_sets(self.grammar).whitespace_str
         return Token(
             strip_func(chars), grammar=self.grammar, decoder=self.decoder
         )
@@ -130,7 +247,7 @@ class Token(str):
         if len(self) == 0:
             return False
 
-        return all(c in self.grammar.whitespace for c in self)
+        return _grammar_sets(self.grammar).whitespace.issuperset(self)
 
     def is_WSC(self) -> bool:
         """Return true if the Token is white space characters or comments
@@ -142,10 +259,12 @@ class Token(str):
         if self.is_space():
             return True
 
-        for ws in reversed(self.grammar.whitespace):
-            temp = self.replace(ws, " ")
-
-        return all(t.is_comment() for t in temp.split())
+        (g, d) = (self.grammar, self.decoder)
+        return all(
+            Token(t, grammar=g, decoder=d).is_comment()
+            for t in _grammar_sets(g).whitespace_re.split(self)
+            if t
+        )
 
     def is_comment(self) -> bool:
         """Return true if the Token is a comment according to the
@@ -190,10 +309,8 @@ class Token(str):
         keyword (e.g. 'BEGIN_GROUP' in PVL) according to
         the Token's grammar, false otherwise.
         """
-        for k in self.grammar.aggregation_keywords.keys():
-            if self.casefold() == k.casefold():
-                return True
-        return False
+        sets = _grammar_sets(self.grammar)
+        return self.casefold() in sets.aggregation_keywords
 
     def is_unquoted_string(self) -> bool:
         """Return false if the Token has any
@@ -202,23 +319,20 @@ class Token(str):
         date, or time according to the Token's grammar,
         true otherwise.
         """
-        for char in self.grammar.reserved_characters:
-            if char in self:
-                return False
+        sets = _grammar_sets(self.grammar)
 
-        for pair in self.grammar.comments:
-            if pair[0] in self:
-                return False
-            if pair[1] in self:
+        # The character checks are cheap, so they go before
+        # asking the decoder about numbers and dates.
+        if not sets.not_unquoted.isdisjoint(self):
+            return False
+
+        for d in sets.comment_delimiters:
+            if d in self:
                 return False
 
         if self.is_numeric() or self.is_datetime():
             return False
 
-        for char in self.grammar.whitespace:
-            if char in self:
-                return False
-
         return True
 
     def is_string(self) -> bool:
@@ -234,9 +348,8 @@ class Token(str):
         isn't a reserved_keyword according to the Token's
         grammar, false otherwise.
         """
-        for word in self.grammar.reserved_keywords:
-            if word.casefold() == self.casefold():
-                return False
+        if self.casefold() in _grammar_sets(self.grammar).reserved_keywords:
+            return False
 
         return self.is_unquoted_string()
 
@@ -244,10 +357,7 @@ class Token(str):
         """Return true if the Token matches an end statement
         from its grammar, false otherwise.
         """
-        for e in self.grammar.end_statements:
-            if e.casefold() == self.casefold():
-                return True
-        return False
+        return self.casefold() in _grammar_sets(self.grammar).end_statements
 
     def isnumeric(self) -> bool:
         """Overrides ``str.isnumeric()`` to be the same as Token's
@@ -20,6 +20,10 @@ from pvl.collections import (
 )
 
 
+# The items that most of the multi-dict tests start from.
+_aba = (("a", 1), ("b", 2), ("a", 3))
+
+
 class DictLike(abc.Mapping):
     def __init__(self):
         self.list = ["a", "b", "a"]
@@ -83,13 +87,14 @@ class TestClasses(unittest.TestCase):
 
 
 class TestMultiDicts(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         try:
             from pvl.collections import PVLMultiDict
 
-            self.classes = (OrderedMultiDict, PVLMultiDict)
+            cls.classes = (OrderedMultiDict, PVLMultiDict)
         except ImportError:
-            self.classes = (OrderedMultiDict,)
+            cls.classes = (OrderedMultiDict,)
 
     def test_empty(self):
         for cls in self.classes:
@@ -100,19 +105,6 @@ class TestMultiDicts(unittest.TestCase):
                 self.assertRaises(KeyError, module.__getitem__, "c")
 
     def test_list_creation(self):
-        class DictLike(abc.Mapping):
-            def __init__(self):
-                self.list = ["a", "b", "a"]
-
-            def __getitem__(self, key):
-                return 42
-
-            def __iter__(self):
-                return iter(self.list)
-
-            def __len__(self):
-                return len(self.list)
-
         for cls in self.classes:
             module = cls([("a", 1), ("b", 2), ("a", 3)])
             with self.subTest(type=type(module)):
@@ -154,7 +146,7 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_key_access(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 self.assertEqual(module.__getitem__("a"), 1)
                 self.assertEqual(module.__getitem__("b"), 2)
@@ -162,7 +154,7 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_index_access(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 self.assertEqual(module.__getitem__(0), ("a", 1))
                 self.assertEqual(module.__getitem__(1), ("b", 2))
@@ -171,7 +163,7 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_slice_access(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 self.assertListEqual(
                     module.__getitem__(slice(0, 3)),
@@ -203,7 +195,7 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_delete(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 del module["a"]
                 self.assertEqual(len(module), 1)
@@ -212,7 +204,7 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_clear(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 module.clear()
                 self.assertEqual(len(module), 0)
@@ -226,14 +218,14 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_pop_noarg(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 self.assertTupleEqual(module.pop(), ("a", 3))
                 self.assertEqual(len(module), 2)
 
     def test_update(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 module.update({"a": 42, "c": 7})
                 self.assertEqual(len(module), 3)
@@ -249,7 +241,7 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_append(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 module.append("a", 42)
                 self.assertEqual(len(module), 4)
@@ -267,7 +259,7 @@ class TestMultiDicts(unittest.TestCase):
             with self.subTest(type=type(module)):
                 self.assertEqual(len(module), 0)
 
-                module = cls([("a", 1), ("b", 2), ("a", 3)])
+                module = cls(_aba)
                 self.assertEqual(len(module), 3)
 
     def test_iterators(self):
@@ -286,7 +278,7 @@ class TestMultiDicts(unittest.TestCase):
                 self.assertEqual(len(module.values()), 0)
                 self.assertNotIn(("1"), module.values())
 
-                the_list = [("a", 1), ("b", 2), ("a", 3)]
+                the_list = list(_aba)
                 module = cls(the_list)
 
                 self.assertListEqual(list(module.items()), the_list)
@@ -320,7 +312,7 @@ class TestMultiDicts(unittest.TestCase):
                 module["c"] = 42
                 self.assertNotEqual(module, copy)
 
-                module = cls([("a", 1), ("b", 2), ("a", 3)])
+                module = cls(_aba)
                 copy = module.copy()
                 self.assertEqual(module, copy)
                 self.assertIsNot(module, copy)
@@ -373,7 +365,7 @@ class TestMultiDicts(unittest.TestCase):
                 self.assertNotIsInstance(group, objcls)
 
     def test_insert(self):
-        the_list = [("a", 1), ("b", 2), ("a", 3)]
+        the_list = list(_aba)
         for cls in self.classes:
             module = cls()
             with self.subTest(type=type(module)):
@@ -408,7 +400,7 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_key_index(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 self.assertRaises(KeyError, module.key_index, "error_key")
                 self.assertRaises(IndexError, module.key_index, "a", 2)
@@ -532,7 +524,7 @@ class TestMultiDicts(unittest.TestCase):
 
     def test_insert_before_after_raises(self):
         for cls in self.classes:
-            module = cls([("a", 1), ("b", 2), ("a", 3)])
+            module = cls(_aba)
             with self.subTest(type=type(module)):
                 self.assertRaises(
                     KeyError, module.insert_before, "error_key", [("fo", "ba")]
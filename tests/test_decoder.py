@@ -20,6 +20,7 @@ import itertools
 import unittest
 from decimal import Decimal
 
+from pvl.grammar import PVLGrammar
 from pvl.decoder import PVLDecoder, ODLDecoder, PDSLabelDecoder, for_try_except
 from pvl.collections import Quantity
 
@@ -153,6 +154,22 @@ class TestDecoder(unittest.TestCase):
         fancy = "2001-001T01:10:39+7"
         self.assertRaises(ValueError, self.d.decode_datetime, fancy)
 
+        g = PVLGrammar()
+        g.date_formats = g.date_formats + ("%b %d %Y",)
+        d = PVLDecoder(grammar=g)
+        self.assertEqual(
+            datetime.date(2001, 1, 27), d.decode_datetime("Jan 27 2001")
+        )
+        self.assertRaises(ValueError, self.d.decode_datetime, "Jan 27 2001")
+
+        g = PVLGrammar()
+        d = PVLDecoder(grammar=g)
+        self.assertRaises(ValueError, d.decode_datetime, "Jan 27 2001")
+        g.date_formats = g.date_formats + ("%b %d %Y",)
+        self.assertEqual(
+            datetime.date(2001, 1, 27), d.decode_datetime("Jan 27 2001")
+        )
+
     def test_decode_simple_value(self):
         for p in (
             ("2001-01-01", datetime.date(2001, 1, 1)),
@@ -18,6 +18,7 @@
 import unittest
 
 from pvl.grammar import PVLGrammar, OmniGrammar
+from pvl.decoder import PVLDecoder
 from pvl.exceptions import LexerError
 
 import pvl.lexer as Lexer
@@ -303,6 +304,20 @@ class TestLexer(unittest.TestCase):
                 out = self.get_tokens(p[0])
                 self.assertEqual(p[1], out)
 
+        # The lexer's decoder decides what is numeric.
+        class NoExponentDecoder(PVLDecoder):
+            def decode_decimal(self, value: str):
+                if "e" in value.lower():
+                    raise ValueError
+                return super().decode_decimal(value)
+
+        g = PVLGrammar()
+        d = NoExponentDecoder(grammar=g)
+        self.assertEqual(
+            ["Scientific_notation:", "2e", "+2"],
+            list(Lexer.lexer("Scientific_notation: 2e+2", g=g, d=d)),
+        )
+
     def test_send(self):
         s = "One Two Three"
         tokens = Lexer.lexer(s)
@@ -19,12 +19,48 @@ import datetime
 import unittest
 
 from pvl.grammar import PVLGrammar
-from pvl.parser import PVLParser, ParseError, OmniParser, EmptyValueAtLine
+from pvl.parser import (
+    PVLParser,
+    ParseError,
+    OmniParser,
+    EmptyValueAtLine,
+    TokenStream,
+)
 from pvl.lexer import lexer as Lexer
 from pvl.lexer import LexerError
+from pvl.token import Token
 from pvl.collections import Quantity, PVLModule, PVLGroup, PVLObject
 
 
+class TestTokenStream(unittest.TestCase):
+    def test_next_send(self):
+        tokens = TokenStream(Lexer("a = b"))
+        self.assertEqual("a", next(tokens))
+        t = next(tokens)
+        self.assertEqual("=", t)
+        self.assertIsNone(tokens.send(t))
+        self.assertIs(t, next(tokens))
+        self.assertEqual(["b"], list(tokens))
+        self.assertRaises(StopIteration, next, tokens)
+
+    def test_window(self):
+        tokens = TokenStream(iter(range(1000)))
+        for i in range(600):
+            self.assertEqual(i, next(tokens))
+        tokens.send(599)
+        self.assertEqual(599, next(tokens))
+        self.assertLessEqual(len(tokens._buf), TokenStream._trim_at)
+        self.assertEqual(list(range(600, 1000)), list(tokens))
+
+    def test_throw(self):
+        tokens = TokenStream(Lexer("a = b"))
+        next(tokens)
+        self.assertRaises(LexerError, tokens.throw, ValueError, "msg")
+
+        tokens = TokenStream(iter(["a", "b"]))
+        self.assertRaises(ValueError, tokens.throw, ValueError, "msg")
+
+
 class TestParse(unittest.TestCase):
     def setUp(self):
         self.p = PVLParser()
@@ -338,6 +374,17 @@ class TestParse(unittest.TestCase):
 
         self.assertRaises(ParseError, self.p.parse, "blob")
 
+        # A stray Parameter Name with no Assignment is dropped, as it
+        # always has been.
+        for s in ("a = 1\n  b\nEND", "b\nEND"):
+            with self.subTest(string=s):
+                self.assertNotIn("b", self.p.parse(s))
+
+        # As is an Aggregation Block that is never ended.
+        for s in ("GROUP = g\nEND", "GROUP = g\n a = 1\nEND"):
+            with self.subTest(string=s):
+                self.assertEqual(PVLModule(), self.p.parse(s))
+
     def test_init_wlexer(self):
         p = PVLParser(lexer_fn=Lexer)
         self.assertIsInstance(p, PVLParser)
@@ -354,6 +401,36 @@ class TestParse(unittest.TestCase):
     def test_aggregation_cls(self):
         self.assertRaises(ValueError, self.p.aggregation_cls, "not begin")
 
+        g = PVLGrammar()
+        p = PVLParser(grammar=g)
+        self.assertRaises(ValueError, p.aggregation_cls, "Foo")
+        g.object_keywords = dict(g.object_keywords, FOO="END_FOO")
+        self.assertIsInstance(p.aggregation_cls("Foo"), PVLObject)
+
+    def test_is_parameter_name(self):
+        for s in ("foo", "a_b", "END", "Group", "a b", "a=b", "5", "-1.5e3",
+                  "16#FF#", "2001-01-01", "a/*b", "a#b", ""):
+            with self.subTest(string=s):
+                t = Token(s, grammar=self.p.grammar, decoder=self.p.decoder)
+                self.assertEqual(
+                    t.is_parameter_name(), self.p._is_parameter_name(s)
+                )
+
+        g = PVLGrammar()
+        g.comments = ()
+        p = PVLParser(grammar=g)
+        self.assertTrue(p._is_parameter_name("foo"))
+        self.assertEqual(PVLModule(a=1), p.parse("a = 1\nEND"))
+
+    def test_decode_simple_value(self):
+        self.assertEqual("Unquoted", self.p._decode_simple_value("Unquoted"))
+        self.assertIn("Unquoted", self.p._value_cache)
+        self.assertEqual(-79, self.p._decode_simple_value("-79"))
+        self.assertRaises(ValueError, self.p._decode_simple_value, "{")
+
+        self.p.parse("a = 1")
+        self.assertNotIn("Unquoted", self.p._value_cache)
+
 
 class TestOmni(unittest.TestCase):
     def setUp(self):
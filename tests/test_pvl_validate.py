@@ -8,7 +8,9 @@
 # top level of this library.
 
 import argparse
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 import pvl.pvl_validate as pvl_val
@@ -34,6 +36,26 @@ class TestMock(unittest.TestCase):
 
         self.assertIsNone(pvl_val.main(["-v", "dummy.txt"]))
 
+    @patch("builtins.print")
+    def test_main_many(self, m_print):
+        with tempfile.TemporaryDirectory() as d:
+            good = Path(d) / "good.lbl"
+            good.write_text("a = b\nEND\n")
+            bad = Path(d) / "bad.lbl"
+            bad.write_text("a = {b\nEND\n")
+
+            self.assertIsNone(pvl_val.main([str(good), str(bad)]))
+
+        report = m_print.call_args[0][0]
+        self.assertLess(report.index(str(good)), report.index(str(bad)))
+
+    @patch("pvl.get_text_from", return_value="a=b")
+    def test_validate_file(self, m_get):
+        f, results = pvl_val.validate_file("dummy.txt")
+        self.assertEqual("dummy.txt", f)
+        self.assertEqual(list(pvl_val.dialects.keys()), list(results.keys()))
+        self.assertEqual((True, True), results["PVL"])
+
     def test_pvl_flavor(self):
         dialect = "PDS3"
         loads, encodes = pvl_val.pvl_flavor(
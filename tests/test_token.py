@@ -15,6 +15,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 import unittest
 
 from pvl.grammar import PVLGrammar
@@ -33,6 +34,11 @@ class TestToken(unittest.TestCase):
             TypeError, Token, s, grammar=PVLGrammar(), decoder="not a decoder"
         )
 
+        self.assertIs(Token("a").grammar, Token("b").grammar)
+        self.assertIs(Token("a").decoder, Token("b").decoder)
+        g = PVLGrammar()
+        self.assertIs(g, Token(s, grammar=g).decoder.grammar)
+
     def test_is_comment(self):
         c = Token("/* comment */")
         self.assertTrue(c.is_comment())
@@ -49,6 +55,13 @@ class TestToken(unittest.TestCase):
         b = Token("END_GROUP")
         self.assertFalse(b.is_begin_aggregation())
 
+        g = PVLGrammar()
+        self.assertFalse(Token("BEGIN_FOO", grammar=g).is_begin_aggregation())
+        g.aggregation_keywords = dict(
+            g.aggregation_keywords, BEGIN_FOO="END_FOO"
+        )
+        self.assertTrue(Token("BEGIN_FOO", grammar=g).is_begin_aggregation())
+
     def test_is_end_statement(self):
         t = Token("END")
         self.assertTrue(t.is_end_statement())
@@ -202,6 +215,11 @@ class TestToken(unittest.TestCase):
                 t = Token(s)
                 self.assertFalse(t.is_WSC())
 
+        g = PVLGrammar()
+        g.whitespace = (" ",)
+        self.assertTrue(Token(" /*com*/", grammar=g).is_WSC())
+        self.assertFalse(Token("\n/*com*/", grammar=g).is_WSC())
+
     def test_is_delimiter(self):
         t = Token(";")
         self.assertTrue(t.is_delimiter())
@@ -235,6 +253,11 @@ class TestToken(unittest.TestCase):
                 t = Token(s)
                 self.assertFalse(t.is_unquoted_string())
 
+        g = PVLGrammar()
+        self.assertTrue(Token("At@Sign", grammar=g).is_unquoted_string())
+        g.reserved_characters = ("@",)
+        self.assertFalse(Token("At@Sign", grammar=g).is_unquoted_string())
+
     def test_is_quoted_string(self):
         for s in ('"Hello &"', "'Product Id'", '""'):
             with self.subTest(string=s):
@@ -306,6 +329,19 @@ class TestToken(unittest.TestCase):
                 t = Token(s)
                 self.assertFalse(t.is_simple_value())
 
+    def test_casefold(self):
+        t = Token("Begin_Group")
+        self.assertEqual("begin_group", t.casefold())
+        self.assertIs(t.casefold(), t.casefold())
+
+    def test_pickle(self):
+        t = Token("Begin_Group", pos=7)
+        t.casefold()
+        u = pickle.loads(pickle.dumps(t))
+        self.assertEqual(t, u)
+        self.assertEqual(7, u.pos)
+        self.assertTrue(u.is_begin_aggregation())
+
     def test_split(self):
         s = "Hello Bob"
         t = Token(s)
@@ -321,6 +357,9 @@ class TestToken(unittest.TestCase):
         self.assertEqual(3, t.__index__())
         self.assertRaises(ValueError, Token("3.4").__index__)
         self.assertRaises(ValueError, Token("a").__index__)
+        self.assertRaisesRegex(
+            ValueError, "cannot be used as an index", Token("2#0101#").__index__
+        )
 
     def test_float(self):
         s = "3.14"